@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Maskeleme mikro-ölçümü: eski (0fe66ec) ve güncel GuvenlikKalkan, aynı sentetik geçmiş satırlarında.
+
+Kullanım: python tests/bench_maskele.py [satır_sayısı=1000000]
+Satırların ~%80'i hiçbir hassas değer içermez (gerçek geçmişe yakın); kalanlar test_maskele.py'deki üreteçten gelir.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from test_maskele import KOMUTLAR, EskiKalkan, mergen, ornek_satirlar
+
+
+def satirlar(adet):
+    r = random.Random(1); hassas = ornek_satirlar(adet)
+    return [next(hassas)[0] if r.random() < .2 else f"{r.choice(KOMUTLAR)} {r.randint(0, 999)}" for _ in range(adet)]
+
+
+def olc(ad, kalkan, liste):
+    t = time.perf_counter()
+    for s in liste: kalkan.maskele(s)
+    sure = time.perf_counter() - t
+    print(f"{ad:6} {sure:7.2f} s  ({sure / len(liste) * 1e6:.2f} µs/satır)")
+    return sure
+
+
+if __name__ == "__main__":
+    adet = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    liste = satirlar(adet)
+    eski = olc("eski", EskiKalkan(), liste)
+    yeni = olc("yeni", mergen.GuvenlikKalkan(), liste)
+    print(f"hızlanma: {eski / yeni:.2f}x")
@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""BulanikIndeks: boş indeks ve artımlı ekleme."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["HOME"] = tempfile.mkdtemp() # Gerçek ~/.mergen_config.json okunmasın
+import mergen_cekirdek as mergen
+
+
+class BulanikIndeksTesti(unittest.TestCase):
+    def test_bos_indeks(self):
+        # Boş veritabanında (hiç satır eklenmemiş) yazarken arama çökmemeli
+        ind = mergen.BulanikIndeks([])
+        for sorgu in ("n", "nm", "nmap", "nm ap", ""): self.assertEqual(ind.ara(sorgu), ([], 0, True))
+
+    def test_sonradan_eklenen_bulunur(self):
+        ind = mergen.BulanikIndeks([(1, "git status", "Git", 3)])
+        self.assertEqual(ind.ara("nm")[1], 0)
+        ind.ekle([(2, "nmap -sV <GIZLI_IP_0>", "Ağ", 1)])
+        self.assertEqual([r[0] for r in ind.ara("nmap")[0]], [2]); self.assertEqual(ind.son_id, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+"""GuvenlikKalkan.maskele: eski (iki aşamalı while/replace) uygulamayla eşdeğerlik kontrolü.
+
+Eski kod birden fazla KEY'de, bir GIZLI etiketinden sonra gelen IP'lerde ve daha uzun bir adresin içinde geçen
+IP'lerde sızdırıyordu; bu durumlarda birebir eşitlik aranmaz, sadece yeni çıktının da sızdırmadığı kontrol edilir.
+Hız karşılaştırması için: python tests/bench_maskele.py [satır_sayısı]
+"""
+
+import os
+import random
+import re
+import sys
+import tempfile
+import unittest
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+os.environ["HOME"] = tempfile.mkdtemp() # Gerçek ~/.mergen_config.json okunmasın
+import mergen_cekirdek as mergen
+
+
+class EskiKalkan:
+    """0fe66ec'deki GuvenlikKalkan, olduğu gibi (referans)."""
+    def __init__(self):
+        self.sayac = 0
+        self.desenler = {
+            'HASSAS_KEY': r'(?i)((?:export\s+)?[\w]*(?:key|secret|token|password|passwd|auth)[\w]*)\s*=\s*(["\']?)([^"\s]+)\2',
+            'IPV4': r'\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b'
+        }
+
+    def maskele(self, metin: str) -> str:
+        if not metin: return ""
+        islenmis = metin
+        while True:
+            bulgu = re.search(self.desenler['HASSAS_KEY'], islenmis)
+            if not bulgu: break
+            tam, deg, _, val = bulgu.group(0), bulgu.group(1), bulgu.group(2), bulgu.group(3)
+            if "GIZLI_" in val: break
+            islenmis = islenmis.replace(tam, f"{deg}=<GIZLI_KEY_{self.sayac}>")
+            self.sayac += 1
+        ip_bulgular = re.findall(self.desenler['IPV4'], islenmis)
+        for ip in ip_bulgular:
+            if "GIZLI" in islenmis and ip in islenmis.split("GIZLI")[1]: continue
+            islenmis = islenmis.replace(ip, f"<GIZLI_IP_{self.sayac}>")
+            self.sayac += 1
+        return islenmis
+
+
+# Sadece KEY/IP kurallarını tetikleyen sözcükler (://, --pass, bearer, ':' vb. sonradan eklenen kurallara girmez)
+KOMUTLAR = ["ls -la", "cd /var/log", "git push origin main", "docker run --rm -it alpine", "ping -c 3", "ssh root@",
+            "nmap -sV", "curl -s http", "python3 app.py", "grep -rn TODO .", "tail -f app.log", "make -j8", "ip route add"]
+ANAHTARLAR = ["API_KEY", "export AWS_SECRET", "GITHUB_TOKEN", "DB_PASSWORD", "passwd", "auth_header", "export STRIPE_KEY"]
+
+
+def ornek_satirlar(adet, tohum=8):
+    """(satır, sızmaması gereken değerler) üretir; aynı tohum aynı satırları verir."""
+    r = random.Random(tohum)
+    for _ in range(adet):
+        parcalar = [r.choice(KOMUTLAR)]; gizliler = []
+        for _ in range(r.choice((0, 0, 1, 1, 2))):
+            deger = "".join(r.choice("abcdef0123456789") for _ in range(r.randint(6, 24)))
+            tirnak = r.choice(("", "", '"', "'"))
+            parcalar.append(f"{r.choice(ANAHTARLAR)}{r.choice(('=', ' = '))}{tirnak}{deger}{tirnak}"); gizliler.append(deger)
+        for _ in range(r.choice((0, 1, 1, 2))):
+            ip = ".".join(str(r.randint(0, 255)) for _ in range(4))
+            parcalar.append(r.choice(("{}", "{}:8080", "--host {}", "{}/24"))
+                            .format(ip) if r.random() < .8 else ip); gizliler.append(ip)
+        r.shuffle(parcalar)
+        yield " ".join(parcalar), gizliler
+
+
+class MaskeleEsdegerlikTesti(unittest.TestCase):
+    def karsilastir(self, satir):
+        return EskiKalkan().maskele(satir), mergen.GuvenlikKalkan().maskele(satir)
+
+    def test_ornekler(self):
+        for satir, beklenen in [
+            ("ls -la", "ls -la"),
+            ("", ""),
+            ("export API_KEY=abc123", "export API_KEY=<GIZLI_KEY_0>"),
+            ("DB_PASSWORD = 'hunter2' ./migrate", "DB_PASSWORD=<GIZLI_KEY_0> ./migrate"),
+            ("ping -c 3 192.168.1.10", "ping -c 3 <GIZLI_IP_0>"),
+            ("curl 10.0.0.5:8080 -d TOKEN=xyz", "curl <GIZLI_IP_1>:8080 -d TOKEN=<GIZLI_KEY_0>"),
+            ("echo <GIZLI_KEY_3>", "echo <GIZLI_KEY_3>"),
+        ]:
+            with self.subTest(satir=satir):
+                eski, yeni = self.karsilastir(satir)
+                self.assertEqual(eski, beklenen); self.assertEqual(yeni, beklenen)
+
+    def test_rastgele_satirlar(self):
+        esit = 0
+        for satir, gizliler in ornek_satirlar(20000):
+            eski, yeni = self.karsilastir(satir)
+            with self.subTest(satir=satir):
+                for g in gizliler: self.assertNotIn(g, yeni)
+                if not any(g in eski for g in gizliler) and eski.count("<GIZLI_") == len(gizliler):
+                    self.assertEqual(yeni, eski); esit += 1
+        self.assertGreater(esit, 10000) # Örneklerin çoğu eski kodun doğru maskelediği satırlar olmalı
+
+    def test_eski_kodun_sizdirdigi_durumlar(self):
+        for satir, gizliler in [
+            ("API_KEY=aaa DB_PASSWORD=bbb ./run", ["aaa", "bbb"]),
+            ("scp 10.0.0.1:/x 10.0.0.2:/y", ["10.0.0.1", "10.0.0.2"]),
+            ("TOKEN=xyz curl 10.0.0.5:8080", ["xyz", "10.0.0.5"]),
+            ("ping 10.0.0.1 && ping 10.0.0.12", ["10.0.0.12"]),
+        ]:
+            with self.subTest(satir=satir):
+                yeni = mergen.GuvenlikKalkan().maskele(satir)
+                for g in gizliler: self.assertNotIn(g, yeni)
+
+
+class CakismaTesti(unittest.TestCase):
+    def test_parola_kurali_aradaki_ipyi_yutmaz(self):
+        # Araç adından parolaya uzanan eşleşme, çakışma çözümünde aradaki hedef IP'yi düşürmemeli
+        for satir, beklenen in [
+            ("nxc smb 10.10.10.5 -u admin -p Passw0rd", "nxc smb <GIZLI_IP_1> -u admin -p <GIZLI_PAROLA_0>"),
+            ("hydra -l admin 192.168.1.20 -p hunter2", "hydra -l admin <GIZLI_IP_1> -p <GIZLI_PAROLA_0>"),
+            ("mysql -h 10.0.0.5 -u root -pS3cret", "mysql -h <GIZLI_IP_1> -u root -p<GIZLI_PAROLA_0>"),
+        ]:
+            with self.subTest(satir=satir): self.assertEqual(mergen.GuvenlikKalkan().maskele(satir), beklenen)
+
+
+class KullaniciKuraliTesti(unittest.TestCase):
+    def kalkan(self, kurallar):
+        eski = mergen.AYARLAR.get("maskeleme_kurallari"); mergen.AYARLAR["maskeleme_kurallari"] = kurallar
+        mergen._MASKE_KURALLARI = None
+        self.addCleanup(lambda: (mergen.AYARLAR.__setitem__("maskeleme_kurallari", eski), setattr(mergen, "_MASKE_KURALLARI", None)))
+        return mergen.GuvenlikKalkan()
+
+    def test_ayni_ad_eklenir_varsayilan_kalir(self):
+        k = self.kalkan([{"ad": "PAROLA", "desen": r"\bpin=(?P<gizli>\d+)", "anahtarlar": ["pin="]},
+                         {"ad": "PAROLA", "desen": r"\bkod:(?P<gizli>\d+)", "anahtarlar": ["kod:"]}])
+        self.assertEqual(k.maskele("hydra -l a -p hunter2 pin=1234 kod:99"),
+                         "hydra -l a -p <GIZLI_PAROLA_0> pin=<GIZLI_PAROLA_1> kod:<GIZLI_PAROLA_2>")
+
+    def test_id_ile_sadece_o_varsayilan_ezilir(self):
+        k = self.kalkan([{"id": "mysql_parola", "ad": "PAROLA", "desen": r"\bmysql\b.*?--sifre=(?P<gizli>\S+)", "anahtarlar": ["mysql"]}])
+        self.assertEqual(k.maskele("mysql -pS3cret --sifre=x"), "mysql -pS3cret --sifre=<GIZLI_PAROLA_0>")
+        self.assertEqual(mergen.GuvenlikKalkan().maskele("sshpass -p hunter2 ssh h"), "sshpass -p <GIZLI_PAROLA_0> ssh h")
+
+
+class IPv6Testi(unittest.TestCase):
+    def test_adresler_maskelenir(self):
+        for satir, beklenen in [
+            ("ping6 fe80::1%eth0", "ping6 <GIZLI_IP6_0>%eth0"),
+            ("ssh root@2001:db8::8a2e:370:7334", "ssh root@<GIZLI_IP6_0>"),
+            ("curl http://[2001:0db8:85a3:0000:0000:8a2e:0370:7334]:80/", "curl http://[<GIZLI_IP6_0>]:80/"),
+            ("ip -6 addr add DEAD:BEEF::CAFE/64 dev eth0", "ip -6 addr add <GIZLI_IP6_0>/64 dev eth0"),
+        ]:
+            with self.subTest(satir=satir): self.assertEqual(mergen.GuvenlikKalkan().maskele(satir), beklenen)
+
+    def test_yanlis_pozitif_yok(self):
+        for satir in ["python3 -c 'print(a[::2])'", "echo dead:beef::", "ping6 ::1", "date +%H:%M:%S 12:30:45",
+                      "ip link set dev eth0 address 00:11:22:33:44:55", "cargo doc std::vec::Vec", "echo a:b:c:d:e:f:0"]:
+            with self.subTest(satir=satir): self.assertEqual(mergen.GuvenlikKalkan().maskele(satir), satir)
+
+
+if __name__ == "__main__":
+    unittest.main()
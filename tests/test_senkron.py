@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+"""Cihazlar arası senkron: iki cihazın günlükleri ortak klasörde, ekleme / kullanım / silme her iki yöne taşınır."""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["HOME"] = tempfile.mkdtemp() # Gerçek ~/.mergen_config.json okunmasın
+import mergen_cekirdek as mergen
+
+
+class SenkronTesti(unittest.TestCase):
+    ANAHTARLAR = ("db_path", "senkron_klasoru", "senkron_cihaz")
+
+    def setUp(self):
+        self.klasor = tempfile.TemporaryDirectory(); self.ortak = os.path.join(self.klasor.name, "senkron")
+        self.eski = {k: mergen.AYARLAR.get(k) for k in self.ANAHTARLAR}
+
+    def tearDown(self):
+        mergen.AYARLAR.update(self.eski); self.klasor.cleanup()
+        if os.path.exists(mergen.CONFIG_FILE): os.remove(mergen.CONFIG_FILE)
+
+    def ac(self, cihaz):
+        """Cihazın DB'sini açar (açılışta diğer cihazların olayları birleştirilir). Aynı anda tek cihaz açık olmalı:
+        cihaz kimliği ve yollar global AYARLAR'dan okunur."""
+        mergen.AYARLAR.update(db_path=os.path.join(self.klasor.name, f"{cihaz}.db"), senkron_klasoru=self.ortak, senkron_cihaz=cihaz)
+        db = mergen.MergenVeritabani(); self.addCleanup(db.kapat)
+        return db
+
+    def kayitlar(self, db):
+        return dict(db.cursor.execute("SELECT ham_komut, kullanim_sayisi FROM komut_gecmisi").fetchall())
+
+    def ekle(self, db, *hamlar):
+        for h in hamlar: db.komut_ekle(h, h, "Shell Geçmişi", "Otomatik", "Sistem")
+
+    def test_iki_cihaz_ekleme_kullanim_silme(self):
+        a = self.ac("a"); self.ekle(a, "ls", "ls", "rm -rf build"); a.kapat()
+        b = self.ac("b")
+        self.assertEqual(self.kayitlar(b), {"ls": 2, "rm -rf build": 1})
+        self.ekle(b, "ls", "git status")
+        b.sil(b.cursor.execute("SELECT id FROM komut_gecmisi WHERE ham_komut = 'rm -rf build'").fetchone()[0]); b.kapat()
+        a = self.ac("a")
+        self.assertEqual(self.kayitlar(a), {"ls": 3, "git status": 1})
+        self.ekle(a, "ls"); a.kapat()
+        b = self.ac("b") # Kendi olayları geri yankılanmaz, a'nınkiler bir kez uygulanır
+        self.assertEqual(self.kayitlar(b), {"ls": 4, "git status": 1})
+
+    def test_cihaz_kimligi_ayara_tek_basina_yazilir(self):
+        mergen.AYARLAR.update(db_path=os.path.join(self.klasor.name, "c.db"), senkron_klasoru=self.ortak, senkron_cihaz="")
+        mergen.AYARLAR["gecici_deger"] = 1; self.addCleanup(mergen.AYARLAR.pop, "gecici_deger", None)
+        with open(mergen.CONFIG_FILE, "w") as f: json.dump({"api_key": "sifreli"}, f)
+        mergen.MergenVeritabani().kapat()
+        with open(mergen.CONFIG_FILE) as f: veri = json.load(f)
+        self.assertEqual(veri, {"api_key": "sifreli", "senkron_cihaz": mergen.AYARLAR["senkron_cihaz"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""KomutSiniflandirici: önekler, VAR=x atamaları ve alt komutlar."""
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["HOME"] = tempfile.mkdtemp() # Gerçek ~/.mergen_config.json okunmasın
+import mergen_cekirdek as mergen
+
+
+class SiniflandiriciTesti(unittest.TestCase):
+    def setUp(self): self.s = mergen.KomutSiniflandirici()
+
+    def test_onekler_atlanir(self):
+        for komut, beklenen in [
+            ("env FOO=1 docker ps", ("docker", "ps")),
+            ("env -i PATH=/bin kubectl get pods", ("kubectl", "get")),
+            ("env -u HOME git status", ("git", "status")),
+            ("sudo -E env A=1 B=2 nmap -sV 10.0.0.1", ("nmap", None)),
+            ("FOO=1 BAR=2 docker ps", ("docker", "ps")),
+            ("sudo -u root timeout 5 /usr/bin/nmap -p 22 x", ("nmap", None)),
+        ]:
+            with self.subTest(komut=komut): self.assertEqual(mergen.KomutSiniflandirici.anahtarlar(komut), beklenen)
+
+    def test_siniflar(self):
+        self.assertEqual(self.s.sinifla("env FOO=1 docker ps"), "Konteyner")
+        self.assertEqual(self.s.sinifla("env | grep PATH"), "Sistem") # Önekten sonra komut yok: env'in kendisi
+        self.assertEqual(self.s.sinifla(""), "Shell Geçmişi")
+
+    def test_ogrenilen_oncelikli(self):
+        s = mergen.KomutSiniflandirici({"docker ps": "Sistem"})
+        self.assertEqual(s.sinifla("env FOO=1 docker ps -a"), "Sistem")
+        self.assertEqual(s.sinifla("docker run alpine"), "Konteyner")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Shell hook yolu (mergen --track): ağır modül yüklememeli ve süre bütçesini aşmamalı."""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BETIK = os.path.join(KOK, "mergen.py")
+# Boş yorumlayıcının üstüne eklenen süre (ms). Ölçüm: ~30 ms; yavaş CI makineleri için ayarlanabilir.
+BUTCE_MS = float(os.environ.get("MERGEN_TRACK_BUTCE_MS", 80))
+
+
+class TrackTesti(unittest.TestCase):
+    def setUp(self):
+        self.ev = tempfile.TemporaryDirectory()
+        self.env = dict(os.environ, HOME=self.ev.name)
+        self.env.pop("PYTHONDONTWRITEBYTECODE", None) # Gerçek kurulumdaki gibi .pyc önbelleği kullanılsın
+
+    def tearDown(self): self.ev.cleanup()
+
+    def calistir(self, *arg):
+        return subprocess.run([sys.executable, *arg], env=self.env, capture_output=True, text=True, check=True)
+
+    def test_agir_modul_yuklenmez(self):
+        kod = ("import runpy, sys; sys.argv = [sys.argv[1], '--track', 'curl -H \"Authorization: Bearer abc\" http://10.0.0.1/']; "
+               "runpy.run_path(sys.argv[0], run_name='__main__'); "
+               "print(' '.join(m for m in sys.modules if m.split('.')[0] in ('PyQt6', 'google', 'curses', 'argparse')))")
+        self.assertEqual(self.calistir("-c", kod, BETIK).stdout.strip(), "")
+
+    def test_sure_butcesi(self):
+        self.calistir(BETIK, "--track", "isinma") # İlk çağrı şemayı kurar ve .pyc yazar
+        def olc(*arg):
+            sureler = []
+            for _ in range(7):
+                t = time.perf_counter(); self.calistir(*arg); sureler.append(time.perf_counter() - t)
+            return statistics.median(sureler) * 1000
+        ek = olc(BETIK, "--track", "ls -la /tmp") - olc("-c", "pass")
+        self.assertLess(ek, BUTCE_MS, f"--track boş yorumlayıcıya {ek:.0f} ms ekliyor (bütçe {BUTCE_MS:.0f} ms)")
+
+    def test_kilitli_veritabani_sessiz(self):
+        # Başka bir yazıcı kilidi tutarken prompt'a traceback basılmamalı (sqlite zaman aşımı ~5 sn)
+        import sqlite3
+        self.calistir(BETIK, "--track", "isinma")
+        kilit = sqlite3.connect(os.path.join(self.ev.name, ".mergen_data.db"), isolation_level=None)
+        kilit.execute("BEGIN IMMEDIATE")
+        try: r = self.calistir(BETIK, "--track", "ls -la")
+        finally: kilit.rollback(); kilit.close()
+        self.assertEqual((r.stdout, r.stderr), ("", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
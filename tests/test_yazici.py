@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Tek yazıcı iş parçacığı: kuyrukta biriken işler tek transaction'da, hata sadece kendi işine döner."""
+
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["HOME"] = tempfile.mkdtemp() # Gerçek ~/.mergen_config.json okunmasın
+import mergen_cekirdek as mergen
+
+
+class YaziciTesti(unittest.TestCase):
+    def setUp(self):
+        self.klasor = tempfile.TemporaryDirectory()
+        self.eski_yol = mergen.AYARLAR["db_path"]; mergen.AYARLAR["db_path"] = os.path.join(self.klasor.name, "t.db")
+        self.db = mergen.MergenVeritabani(birlestir=False)
+
+    def tearDown(self):
+        self.db.kapat(); mergen.AYARLAR["db_path"] = self.eski_yol; self.klasor.cleanup()
+
+    def ekle(self, ham, hata=False):
+        self.db.cursor.execute("INSERT INTO komut_gecmisi (ham_komut, maskelenmis_komut) VALUES (?, ?)", (ham, ham))
+        if hata: raise ValueError(ham)
+
+    def parti(self, *isler):
+        """Yazıcıyı bekletip işleri kuyruğa dizer, sonra hepsini tek partide bırakır."""
+        kapi = threading.Event(); self.db.yaz(kapi.wait, 5)
+        sonuclar = [self.db.yaz(self.ekle, *i) for i in isler]; kapi.set()
+        for s in sonuclar: s._olay.wait(5)
+        return sonuclar
+
+    def hamlar(self):
+        self.db.cursor.execute("SELECT ham_komut FROM komut_gecmisi ORDER BY id")
+        return [r[0] for r in self.db.cursor.fetchall()]
+
+    def test_hata_sadece_kendi_isine_doner(self):
+        a, b, c = self.parti(("a",), ("b", True), ("c",))
+        self.assertIsNone(a.result()); self.assertIsNone(c.result())
+        with self.assertRaises(ValueError): b.result()
+        self.assertEqual(self.hamlar(), ["a", "c"])
+
+    def test_parti_tek_transaction_savepoint_yok(self):
+        # İş başına SAVEPOINT, FTS5'in bekleyen indeksini her satırda boşaltıp toplu yazmayı 4-5 kat yavaşlatıyordu
+        komutlar = []
+        self.db.yaz(lambda: self.db.conn.set_trace_callback(komutlar.append)).result()
+        self.parti(("a",), ("b",), ("c",))
+        self.db.yaz(lambda: self.db.conn.set_trace_callback(None)).result()
+        ozet = [k.split()[0].upper() for k in komutlar if k.split()[0].upper() in ("BEGIN", "COMMIT", "SAVEPOINT", "RELEASE")]
+        self.assertEqual(ozet.count("SAVEPOINT"), 0)
+        self.assertEqual(self.hamlar(), ["a", "b", "c"])
+        self.assertLessEqual(ozet.count("COMMIT"), 2) # Kapı işi + üç ekleme en fazla iki partide
+
+    def test_gecmis_yarida_kalirsa_tekrar_sayilmaz(self):
+        gecmis = os.path.join(self.klasor.name, "history"); open(gecmis, "w").write("ls\npwd\nwhoami\n")
+        asil = self.db._upsert; cagri = []
+        def bozuk(*a, **k):
+            cagri.append(1)
+            if len(cagri) == 2: raise mergen.sqlite3.OperationalError("disk I/O error") # İkinci parçada kesilir
+            return asil(*a, **k)
+        self.db._upsert = bozuk
+        self.assertEqual(self.db.toplu_gecmis_yukle(gecmis, mergen.GuvenlikKalkan(), parca_boyu=1, sessiz=True), 0)
+        self.assertEqual(self.hamlar(), []) # İlk parça da geri alındı
+        self.db._upsert = asil
+        self.assertEqual(self.db.toplu_gecmis_yukle(gecmis, mergen.GuvenlikKalkan(), parca_boyu=1, sessiz=True), 3)
+        self.db.cursor.execute("SELECT MAX(kullanim_sayisi) FROM komut_gecmisi")
+        self.assertEqual(self.db.cursor.fetchone()[0], 1)
+
+    def test_gecmis_silinen_bilinen_komut_maskesiz_eklenmez(self):
+        # mevcut_komutlar() ile yazma arasında silinen satır, maskelenmemiş ham komutla geri gelmemeli
+        self.db.yaz(self.ekle, "pwd").result()
+        # "pwd" ve "mysql -pS3cret" var sanılıyor (maskelenmedi); ikincisi bu arada silinmiş
+        kayitlar = self.db._gecmis_kayitlari({"pwd": 2, "mysql -pS3cret": 2, "ls": 1}, {"ls": "ls"}, mergen.KomutSiniflandirici())
+        self.db._gecmis_parcasi_yaz(kayitlar)
+        self.db.cursor.execute("SELECT ham_komut, maskelenmis_komut, kullanim_sayisi FROM komut_gecmisi ORDER BY id")
+        self.assertEqual(self.db.cursor.fetchall(), [("pwd", "pwd", 3), ("ls", "ls", 1)])
+
+
+if __name__ == "__main__":
+    unittest.main()
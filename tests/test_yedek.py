@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""Yedek okuma: eski JSON dizisi ve satır satır JSON, parça sınırlarından bağımsız."""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["HOME"] = tempfile.mkdtemp() # Gerçek ~/.mergen_config.json okunmasın
+import mergen_cekirdek as mergen
+
+KAYITLAR = [{"ham_komut": f"echo {i} \"tırnak\" , ]", "kategori": "Sistem", "kullanim_sayisi": i} for i in range(50)]
+
+
+class JsonDizisiTesti(unittest.TestCase):
+    def oku(self, metin, parca):
+        f = io.StringIO(metin); return list(mergen._json_dizisi_oku(f, f.read(parca), parca))
+
+    def test_parca_sinirlari(self):
+        for metin in (json.dumps(KAYITLAR, ensure_ascii=False), json.dumps(KAYITLAR, ensure_ascii=False, indent=2)):
+            for parca in (1, 3, 17, 1 << 16):
+                with self.subTest(parca=parca): self.assertEqual(self.oku(metin, parca), KAYITLAR)
+
+    def test_bos_ve_bozuk(self):
+        self.assertEqual(self.oku(" [ ] ", 2), [])
+        with self.assertRaises(ValueError): self.oku('[{"a": 1}, {"b":', 4)
+        with self.assertRaises(ValueError): self.oku('{"a": 1}', 4)
+
+    def test_satir_satir(self):
+        metin = "\n".join(json.dumps(k, ensure_ascii=False) for k in KAYITLAR) + "\n"
+        f = io.StringIO(metin)
+        self.assertEqual(list(mergen._json_satirlari_oku(f, f.readline())), KAYITLAR)
+
+
+if __name__ == "__main__":
+    unittest.main()